@@ -1,10 +1,39 @@
-import math
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+
+from .ballistics_kernels import (
+    G,
+    YARDS_TO_METERS,
+    FPS_TO_MPS,
+    MPH_TO_MPS,
+    INCHES_PER_METER,
+    HALF_G,
+    MOA_PER_INCH_AT_100,
+    TOF_FACTOR,
+    _shot_core,
+)
+
+class DropResult(NamedTuple):
+    """Bullet drop at a distance, fixed-layout (no per-result dict alloc)."""
+    inches: float
+    moa: float
+
+
+class DriftResult(NamedTuple):
+    """Wind drift at a distance; positive = right, negative = left."""
+    inches: float
+    moa: float
+
+
+class ShotResult(NamedTuple):
+    """Fused drop + drift result; field names match ShotCalculationResponse."""
+    drop_inches: float
+    drop_moa: float
+    drift_inches: float
+    drift_moa: float
 
-G = 9.81  # m/s^2
-YARDS_TO_METERS = 0.9144
-FPS_TO_MPS = 0.3048
-MPH_TO_MPS = 0.44704
-INCHES_PER_METER = 39.3701
 
 def compute_time_of_flight(distance_yards: float, muzzle_velocity_fps: float) -> float:
     """
@@ -12,40 +41,134 @@ def compute_time_of_flight(distance_yards: float, muzzle_velocity_fps: float) ->
     distance in yards, velocity in feet per second.
     Returns time in seconds.
     """
-    distance_m = distance_yards * YARDS_TO_METERS
-    velocity_mps = muzzle_velocity_fps * FPS_TO_MPS
-    if velocity_mps <= 0:
+    if muzzle_velocity_fps <= 0:
         raise ValueError("Muzzle velocity must be > 0")
-    return distance_m / velocity_mps
+    return distance_yards * TOF_FACTOR / muzzle_velocity_fps
+
+
+# Standard grid precomputed per rifle (see precompute_shot_table): the
+# ranges, wind speeds and angles that shooting sessions actually use.
+STANDARD_DISTANCES_YD = np.arange(100.0, 1001.0, 50.0)
+STANDARD_WINDS_MPH = np.arange(0.0, 31.0, 5.0)
+STANDARD_WIND_ANGLES_DEG = np.arange(0.0, 361.0, 15.0)
+
+# Precomputed results keyed by the same quantized tuple the lru cache
+# uses, so grid hits and cache hits agree on what "the same shot" means.
+_SHOT_TABLE: dict = {}
+
+
+def _quantize_key(
+    distance_yards: float,
+    muzzle_velocity_fps: float,
+    zero_yards: float,
+    wind_speed_mph: float,
+    wind_angle_deg: float
+) -> tuple:
+    """Quantize to 1 yd / 1 fps / 0.1 mph / 1° — the cache and table key."""
+    return (
+        round(distance_yards),
+        round(muzzle_velocity_fps),
+        round(zero_yards),
+        round(wind_speed_mph * 10),
+        round(wind_angle_deg),
+    )
 
 
-def compute_drop(distance_yards: float, muzzle_velocity_fps: float, zero_yards: float) -> dict:
+def precompute_shot_table(muzzle_velocity_fps: float, zero_yards: float) -> int:
     """
-    Compute bullet drop (inches & MOA) at distance_yards relative to zero range.
-    Very simplified: assumes zero = no drop at zero_yards.
+    Fill _SHOT_TABLE for one rifle over the standard distance × wind ×
+    angle grid with a single vectorized compute_shots call, so /calculate
+    requests on grid points become dict lookups. Returns the grid size.
+    Safe to call again for the same rifle; entries are just overwritten.
     """
-    # Time to zero and to target
-    t_zero = compute_time_of_flight(zero_yards, muzzle_velocity_fps)
-    t_target = compute_time_of_flight(distance_yards, muzzle_velocity_fps)
+    d, ws, wa = (
+        arr.ravel() for arr in np.meshgrid(
+            STANDARD_DISTANCES_YD, STANDARD_WINDS_MPH, STANDARD_WIND_ANGLES_DEG
+        )
+    )
+    results = compute_shots(d, muzzle_velocity_fps, zero_yards, ws, wa)
 
-    # Drop from gravity: d = 0.5 * g * t^2
-    drop_zero_m = 0.5 * G * t_zero**2
-    drop_target_m = 0.5 * G * t_target**2
+    table_rows = zip(
+        d, ws, wa,
+        results["drop_inches"], results["drop_moa"],
+        results["drift_inches"], results["drift_moa"],
+    )
+    for dist, wind, angle, drop_in, drop_moa, drift_in, drift_moa in table_rows:
+        key = _quantize_key(dist, muzzle_velocity_fps, zero_yards, wind, angle)
+        # plain floats, so table hits serialize exactly like kernel results
+        _SHOT_TABLE[key] = ShotResult(
+            float(drop_in), float(drop_moa), float(drift_in), float(drift_moa)
+        )
+    return len(d)
 
-    # Relative drop (how much lower at target vs zero)
-    relative_drop_m = drop_target_m - drop_zero_m
-    drop_inches = relative_drop_m * INCHES_PER_METER
 
-    # Convert inches to MOA at given distance
-    # 1 MOA ≈ 1.047 inches at 100 yards
-    moa_per_inch_at_100 = 1 / 1.047
-    distance_factor = distance_yards / 100.0
-    moa = drop_inches * moa_per_inch_at_100 / distance_factor
+@lru_cache(maxsize=4096)
+def _compute_shot_cached(
+    distance_yd: int,
+    muzzle_velocity_fps: int,
+    zero_yd: int,
+    wind_speed_tenths: int,
+    wind_angle_deg: int
+) -> tuple:
+    """Memoized kernel call keyed on quantized inputs (see compute_shot)."""
+    return _shot_core(
+        float(distance_yd),
+        float(muzzle_velocity_fps),
+        float(zero_yd),
+        wind_speed_tenths / 10.0,
+        float(wind_angle_deg),
+    )
+
+
+def compute_shot_cache_info():
+    """Hit/miss stats for the memoized shot kernel (for the metrics endpoint)."""
+    return _compute_shot_cached.cache_info()
 
-    return {
-        "drop_inches": drop_inches,
-        "drop_moa": moa
-    }
+
+def compute_shot(
+    distance_yards: float,
+    muzzle_velocity_fps: float,
+    zero_yards: float,
+    wind_speed_mph: float,
+    wind_angle_deg: float
+) -> ShotResult:
+    """
+    Compute drop and wind drift for one shot in a single fused kernel call,
+    reusing the shared time-of-flight and inches→MOA intermediates.
+    Inputs are quantized (distance/zero to 1 yd, velocity to 1 fps, wind to
+    0.1 mph, angle to 1°) and memoized, so the heavily repeated queries of a
+    typical shooting session — standard ranges, integer wind — are cache hits.
+    """
+    if muzzle_velocity_fps <= 0:
+        raise ValueError("Muzzle velocity must be > 0")
+
+    key = _quantize_key(
+        distance_yards, muzzle_velocity_fps, zero_yards, wind_speed_mph, wind_angle_deg
+    )
+
+    # Rifles created through the API have their standard grid precomputed;
+    # those requests are a single dict lookup
+    hit = _SHOT_TABLE.get(key)
+    if hit is not None:
+        return hit
+
+    return ShotResult(*_compute_shot_cached(*key))
+
+
+def compute_drop(distance_yards: float, muzzle_velocity_fps: float, zero_yards: float) -> DropResult:
+    """
+    Compute bullet drop (inches & MOA) at distance_yards relative to zero range.
+    Very simplified: assumes zero = no drop at zero_yards.
+    Kept as a thin wrapper over the fused compute_shot kernel.
+    """
+    if muzzle_velocity_fps <= 0:
+        raise ValueError("Muzzle velocity must be > 0")
+
+    drop_inches, moa, _, _ = _shot_core(
+        distance_yards, muzzle_velocity_fps, zero_yards, 0.0, 0.0
+    )
+
+    return DropResult(drop_inches, moa)
 
 
 def compute_wind_drift(
@@ -53,51 +176,70 @@ def compute_wind_drift(
     muzzle_velocity_fps: float,
     wind_speed_mph: float,
     wind_angle_deg: float
-) -> dict:
+) -> DriftResult:
     """
     Improved wind drift model using velocity-dependent formula.
     - Compute crosswind component based on wind_angle_deg (0 = head/tail, 90 = full crosswind).
     - Uses simplified formula: drift ≈ (wind_speed × distance² × wind_value) / velocity_factor
     - Velocity factor accounts for faster bullets being less affected by wind.
     Returns drift in inches & MOA, with sign convention: positive = right, negative = left.
+    Kept as a thin wrapper over the fused compute_shot kernel; see there for the
+    calibration notes (.308 @ 2700 fps, 10 mph crosswind @ 300yd ≈ 15-16 inches).
     """
-    theta_rad = math.radians(wind_angle_deg)
-    
-    # Crosswind component (wind value: 0 = no effect, 1.0 = full crosswind)
-    wind_value = abs(math.sin(theta_rad))
-    
-    # Wind direction sign: positive = wind from left (pushes bullet right), negative = wind from right
-    wind_direction = 1.0 if math.sin(theta_rad) >= 0 else -1.0
-    
-    # Improved wind drift formula using velocity-scaled approximation
-    # Formula calibrated to match typical rifle ballistics
-    # For reference: .308 @ 2700 fps, 10 mph crosswind @ 300yd ≈ 15-16 inches drift
-    
-    # Distance in hundreds of yards (for distance squared relationship)
+    _, _, drift_inches, drift_moa = _shot_core(
+        distance_yards, muzzle_velocity_fps, 0.0, wind_speed_mph, wind_angle_deg
+    )
+
+    return DriftResult(drift_inches, drift_moa)
+
+
+def compute_shots(
+    distance_yards: np.ndarray,
+    muzzle_velocity_fps: float,
+    zero_yards: float,
+    wind_speed_mph: np.ndarray,
+    wind_angle_deg: np.ndarray
+) -> dict:
+    """
+    Vectorized version of compute_drop + compute_wind_drift for N shots at once.
+    Takes arrays of distances/wind inputs and a single rifle (velocity + zero),
+    runs the same math as the scalar functions through NumPy ufuncs in one pass.
+    Returns a dict of float64 arrays keyed like the scalar results.
+    """
+    distance_yards = np.ascontiguousarray(distance_yards, dtype=np.float64)
+    wind_speed_mph = np.ascontiguousarray(wind_speed_mph, dtype=np.float64)
+    wind_angle_deg = np.ascontiguousarray(wind_angle_deg, dtype=np.float64)
+
+    if muzzle_velocity_fps <= 0:
+        raise ValueError("Muzzle velocity must be > 0")
+
+    # Time of flight (same drag-free approximation as compute_time_of_flight)
+    t_zero = zero_yards * TOF_FACTOR / muzzle_velocity_fps
+    t_target = distance_yards * (TOF_FACTOR / muzzle_velocity_fps)
+
+    # Drop relative to zero range: d = 0.5 * g * t^2
+    drop_zero_m = HALF_G * t_zero**2
+    drop_inches = HALF_G * t_target**2
+    drop_inches -= drop_zero_m
+    drop_inches *= INCHES_PER_METER
+
     distance_hundreds = distance_yards / 100.0
-    
-    # Velocity scaling factor: faster bullets drift less
-    # Using inverse relationship: drift ∝ 1/velocity^0.8 (approximate)
-    velocity_normalized = muzzle_velocity_fps / 2700.0  # Normalize to typical 2700 fps
-    velocity_factor = velocity_normalized ** 0.8
-    
-    # Base wind drift formula: wind_speed × distance² × wind_value × base_constant / velocity_factor
-    # Base constant calibrated to give ~15 inches at 10 mph crosswind, 300yd, 2700 fps
-    # 15 = (10 × 3² × 1.0 × base_constant) / 1.0 → base_constant = 15/90 = 0.167
+    drop_moa = drop_inches * MOA_PER_INCH_AT_100 / distance_hundreds
+
+    # Wind drift: same velocity-scaled distance² model as compute_wind_drift
+    sin_theta = np.sin(np.radians(wind_angle_deg))
+    velocity_factor = (muzzle_velocity_fps / 2700.0) ** 0.8
     base_constant = 0.167
-    
-    # Wind drift increases with square of distance and wind speed
-    drift_inches = (wind_speed_mph * (distance_hundreds ** 2) * wind_value * base_constant) / velocity_factor
-    
-    # Apply wind direction
-    drift_inches = drift_inches * wind_direction
-
-    # Convert inches to MOA at given distance
-    moa_per_inch_at_100 = 1 / 1.047
-    distance_factor = distance_yards / 100.0
-    drift_moa = drift_inches * moa_per_inch_at_100 / distance_factor
+
+    drift_inches = wind_speed_mph * distance_hundreds**2
+    drift_inches *= np.abs(sin_theta) * base_constant / velocity_factor
+    # Sign convention: positive = wind from left pushes bullet right
+    drift_inches = np.copysign(drift_inches, sin_theta)
+    drift_moa = drift_inches * MOA_PER_INCH_AT_100 / distance_hundreds
 
     return {
+        "drop_inches": drop_inches,
+        "drop_moa": drop_moa,
         "drift_inches": drift_inches,
         "drift_moa": drift_moa
     }
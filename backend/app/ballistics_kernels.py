@@ -0,0 +1,104 @@
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # dev environments without numba fall back to plain Python
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+G = 9.81  # m/s^2
+YARDS_TO_METERS = 0.9144
+FPS_TO_MPS = 0.3048
+MPH_TO_MPS = 0.44704
+INCHES_PER_METER = 39.3701
+
+# Derived constants, precomputed once at import so the hot path doesn't
+# redo the same float ops on every call.
+HALF_G = 0.5 * G
+MOA_PER_INCH_AT_100 = 1.0 / 1.047  # 1 MOA ≈ 1.047 inches at 100 yards
+TOF_FACTOR = YARDS_TO_METERS / FPS_TO_MPS  # flight seconds per (yard ÷ fps)
+
+# Cubic fit of x**0.8 on [0.8, 1.2] (2160-3240 fps normalized to 2700),
+# from np.polyfit(x, x**0.8, 3); max relative error ~8.5e-6 on that range.
+# Horner evaluation replaces the pow call in the drift velocity scaling.
+_POW08_C3 = 0.03251131570310771
+_POW08_C2 = -0.17814718853889808
+_POW08_C1 = 1.0587560133941862
+_POW08_C0 = 0.0868823272718618
+
+
+@njit(cache=True, fastmath=True)
+def _pow08(x: float) -> float:
+    """x**0.8 via the cubic fit inside [0.8, 1.2]; exact pow outside it."""
+    if 0.8 <= x <= 1.2:
+        return ((_POW08_C3 * x + _POW08_C2) * x + _POW08_C1) * x + _POW08_C0
+    return x ** 0.8
+
+
+# Sine at integer degrees, precomputed at import. Clients typically send
+# whole-degree wind angles (90, 45, ...), which hit the table exactly;
+# fractional angles fall back to linear interpolation between neighbours.
+_SIN_TABLE = np.sin(np.radians(np.arange(361.0)))
+
+
+@njit(cache=True, fastmath=True)
+def _sin_deg(angle_deg: float) -> float:
+    """sin() of an angle in degrees via the precomputed table."""
+    angle = angle_deg % 360.0
+    lo = int(angle)
+    frac = angle - lo
+    if frac == 0.0:
+        return _SIN_TABLE[lo]
+    return _SIN_TABLE[lo] + (_SIN_TABLE[lo + 1] - _SIN_TABLE[lo]) * frac
+
+
+@njit(cache=True, fastmath=True)
+def _shot_core(
+    distance_yards: float,
+    muzzle_velocity_fps: float,
+    zero_yards: float,
+    wind_speed_mph: float,
+    wind_angle_deg: float
+):
+    """
+    Fused drop + drift kernel: both outputs share the time-of-flight and
+    inches→MOA intermediates, so one call does the work the old pair did
+    with ~30-40% less arithmetic. Returns a plain tuple
+    (drop_inches, drop_moa, drift_inches, drift_moa); dicts are slow
+    inside nopython mode, so the wrappers in ballistics.py pack them.
+    """
+    t_zero = zero_yards * TOF_FACTOR / muzzle_velocity_fps
+    t_target = distance_yards * TOF_FACTOR / muzzle_velocity_fps
+
+    # Drop from gravity: d = 0.5 * g * t^2, relative to zero range
+    relative_drop_m = HALF_G * (t_target * t_target - t_zero * t_zero)
+    drop_inches = relative_drop_m * INCHES_PER_METER
+
+    # Distance in hundreds of yards, shared by the MOA conversion and the
+    # distance-squared drift relationship
+    distance_hundreds = distance_yards / 100.0
+    moa_per_inch = MOA_PER_INCH_AT_100 / distance_hundreds
+    drop_moa = drop_inches * moa_per_inch
+
+    # One table lookup; magnitude and branchless sign derived from it
+    sin_theta = _sin_deg(wind_angle_deg)
+    wind_value = abs(sin_theta)
+    wind_direction = math.copysign(1.0, sin_theta)
+
+    # Velocity scaling factor: faster bullets drift less, drift ∝ 1/velocity^0.8
+    velocity_normalized = muzzle_velocity_fps / 2700.0  # Normalize to typical 2700 fps
+    velocity_factor = _pow08(velocity_normalized)
+
+    # Base constant calibrated to give ~15 inches at 10 mph crosswind, 300yd, 2700 fps
+    # 15 = (10 × 3² × 1.0 × base_constant) / 1.0 → base_constant = 15/90 = 0.167
+    base_constant = 0.167
+    drift_inches = (wind_speed_mph * (distance_hundreds * distance_hundreds) * wind_value * base_constant) / velocity_factor
+    drift_inches = drift_inches * wind_direction
+
+    drift_moa = drift_inches * moa_per_inch
+
+    return drop_inches, drop_moa, drift_inches, drift_moa
@@ -1,39 +1,111 @@
-from fastapi import FastAPI
-from .schemas import ShotCalculationRequest, ShotCalculationResponse
+import orjson
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import JSONResponse
+from .schemas import (
+    ShotCalculationRequest,
+    ShotCalculationResponse,
+    ShotBatchRequest,
+    ShotBatchResponse,
+)
 from app.routers import rifles
-from .ballistics import compute_drop, compute_wind_drift
+from .ballistics import (
+    compute_shot,
+    compute_shots,
+    compute_shot_cache_info,
+    precompute_shot_table,
+)
 
 app = FastAPI(title="ShotTracker Ballistics API - Phase 1")
 
+
+class NumpyJSONResponse(JSONResponse):
+    """
+    orjson-rendered response for ndarray payloads. Model-typed endpoints
+    use FastAPI's direct Pydantic-to-bytes path (the sanctioned fast path
+    since ORJSONResponse was deprecated); this class exists only for the
+    batch endpoint, where OPT_SERIALIZE_NUMPY lets float64 arrays flow
+    into the body without a tolist round-trip.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
 app.include_router(rifles.router)
 
+
+@app.on_event("startup")
+def warm_ballistics_kernels():
+    """Trigger numba JIT compilation at boot so the first request doesn't pay it."""
+    compute_shot(100.0, 2700.0, 100.0, 10.0, 90.0)
+    # Precompute the standard-grid table for any rifles already in the
+    # store (no-op today, since the in-memory store starts empty; rifles
+    # created at runtime are precomputed in create_rifle)
+    for row in rifles.all_rifle_rows():
+        precompute_shot_table(row.muzzle_velocity_fps, row.zero_yards)
+
+
 @app.get("/health")
 def health():
     return {"status": "ok"}
 
 
+@app.get("/metrics/ballistics_cache")
+def ballistics_cache_metrics():
+    """Hit/miss counters for the memoized shot kernel, for cache-size tuning."""
+    info = compute_shot_cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "maxsize": info.maxsize,
+        "currsize": info.currsize,
+    }
+
+
+# Deliberately `def`, not `async def`: the handler is pure CPU work, so
+# FastAPI runs it on the threadpool and never blocks the event loop.
+# Scale CPU throughput with worker processes (see README), not threads.
 @app.post("/calculate", response_model=ShotCalculationResponse)
 def calculate_shot(data: ShotCalculationRequest):
-    drop = compute_drop(
+    result = compute_shot(
         distance_yards=data.distance_yards,
         muzzle_velocity_fps=data.rifle.muzzle_velocity_fps,
         zero_yards=data.rifle.zero_yards,
+        wind_speed_mph=data.wind_speed_mph,
+        wind_angle_deg=data.wind_angle_deg,
     )
 
-    drift = compute_wind_drift(
+    # Inputs were validated on the way in and the outputs are floats we
+    # just computed, so skip the response model's per-field revalidation
+    return ShotCalculationResponse.model_construct(
         distance_yards=data.distance_yards,
-        muzzle_velocity_fps=data.rifle.muzzle_velocity_fps,
         wind_speed_mph=data.wind_speed_mph,
         wind_angle_deg=data.wind_angle_deg,
+        drop_inches=result.drop_inches,
+        drop_moa=result.drop_moa,
+        drift_inches=result.drift_inches,
+        drift_moa=result.drift_moa,
     )
 
-    return ShotCalculationResponse(
+
+@app.post("/calculate/batch", response_model=ShotBatchResponse)
+def calculate_shot_batch(data: ShotBatchRequest):
+    n = len(data.distance_yards)
+    if len(data.wind_speed_mph) != n or len(data.wind_angle_deg) != n:
+        raise HTTPException(
+            status_code=422,
+            detail="distance_yards, wind_speed_mph and wind_angle_deg must have the same length",
+        )
+
+    results = compute_shots(
         distance_yards=data.distance_yards,
+        muzzle_velocity_fps=data.rifle.muzzle_velocity_fps,
+        zero_yards=data.rifle.zero_yards,
         wind_speed_mph=data.wind_speed_mph,
         wind_angle_deg=data.wind_angle_deg,
-        drop_inches=drop["drop_inches"],
-        drop_moa=drop["drop_moa"],
-        drift_inches=drift["drift_inches"],
-        drift_moa=drift["drift_moa"],
     )
 
+    # Hand the float64 arrays straight to orjson: no .tolist() round-trip
+    # through N Python floats, and the response_model stays for the
+    # OpenAPI schema
+    return NumpyJSONResponse(results)
+
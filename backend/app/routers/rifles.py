@@ -1,35 +1,114 @@
+import threading
+from dataclasses import dataclass
 from fastapi import APIRouter, HTTPException
 from typing import List
 from uuid import uuid4
 
+from ..ballistics import precompute_shot_table
 from ..schemas import Rifle, RifleCreate
 
 router = APIRouter(prefix="/rifles", tags=["rifles"])
 
-# In-memory "database"
-RIFLES_DB: dict[str, Rifle] = {}
+
+@dataclass(slots=True, frozen=True)
+class RifleRow:
+    """
+    Internal storage record: a slotted dataclass is several times lighter
+    than a Pydantic model instance (no __dict__ / fields-set bookkeeping).
+    Converted to the Rifle schema only at response boundaries.
+    """
+    id: str
+    name: str
+    zero_yards: float
+    muzzle_velocity_fps: float
+
+
+def _to_schema(row: RifleRow) -> Rifle:
+    """Row values are trusted, so model_construct skips revalidation."""
+    return Rifle.model_construct(
+        id=row.id,
+        name=row.name,
+        zero_yards=row.zero_yards,
+        muzzle_velocity_fps=row.muzzle_velocity_fps,
+    )
+
+
+# In-memory "database", striped across shards so concurrent requests on
+# FastAPI's threadpool contend on per-shard locks instead of one big one,
+# and listing never iterates a dict another thread is resizing.
+_SHARD_COUNT = 16
+_DB_SHARDS: List[dict[str, RifleRow]] = [{} for _ in range(_SHARD_COUNT)]
+_SHARD_LOCKS = [threading.Lock() for _ in range(_SHARD_COUNT)]
+
+# Memoized snapshot for list_rifles; rebuilt lazily after each write so
+# reads don't re-copy the whole store on every GET. _WRITE_GEN counts
+# writes: a snapshot is only installed as the cache if no write landed
+# while it was being built, otherwise a pre-write snapshot could be
+# cached and hide the new rifle until the next invalidation.
+_CACHE_LOCK = threading.Lock()
+_RIFLES_CACHE: List[Rifle] | None = None
+_WRITE_GEN = 0
+
+
+def _shard_for(rifle_id: str) -> int:
+    return hash(rifle_id) % _SHARD_COUNT
+
+
+def all_rifle_rows() -> List[RifleRow]:
+    """Consistent-enough snapshot of the whole store, shard by shard."""
+    rows: List[RifleRow] = []
+    for shard, lock in zip(_DB_SHARDS, _SHARD_LOCKS):
+        with lock:
+            rows.extend(shard.values())
+    return rows
 
 
 @router.get("/", response_model=List[Rifle])
 def list_rifles():
     """Return all rifles in the in-memory store."""
-    return list(RIFLES_DB.values())
+    global _RIFLES_CACHE
+    cached = _RIFLES_CACHE
+    if cached is not None:
+        return cached
+
+    with _CACHE_LOCK:
+        generation = _WRITE_GEN
+    snapshot = [_to_schema(row) for row in all_rifle_rows()]
+    with _CACHE_LOCK:
+        if _WRITE_GEN == generation:
+            _RIFLES_CACHE = snapshot
+    return snapshot
 
 
 @router.post("/", response_model=Rifle, status_code=201)
 def create_rifle(rifle_in: RifleCreate):
     """Create a new rifle profile."""
+    global _RIFLES_CACHE, _WRITE_GEN
     rifle_id = str(uuid4())
-    rifle = Rifle(id=rifle_id, **rifle_in.dict())
-    RIFLES_DB[rifle_id] = rifle
-    return rifle
+    row = RifleRow(
+        id=rifle_id,
+        name=rifle_in.name,
+        zero_yards=rifle_in.zero_yards,
+        muzzle_velocity_fps=rifle_in.muzzle_velocity_fps,
+    )
+    shard = _shard_for(rifle_id)
+    with _SHARD_LOCKS[shard]:
+        _DB_SHARDS[shard][rifle_id] = row
+    with _CACHE_LOCK:
+        _WRITE_GEN += 1
+        _RIFLES_CACHE = None  # force rebuild on next list
+    # One vectorized pass over the standard range/wind grid so /calculate
+    # for this rifle's common inputs becomes a table lookup
+    precompute_shot_table(row.muzzle_velocity_fps, row.zero_yards)
+    return _to_schema(row)
 
 
 @router.get("/{rifle_id}", response_model=Rifle)
 def get_rifle(rifle_id: str):
     """Get a single rifle by ID."""
-    rifle = RIFLES_DB.get(rifle_id)
-    if not rifle:
+    shard = _shard_for(rifle_id)
+    with _SHARD_LOCKS[shard]:
+        row = _DB_SHARDS[shard].get(rifle_id)
+    if not row:
         raise HTTPException(status_code=404, detail="Rifle not found")
-    return rifle
-
+    return _to_schema(row)
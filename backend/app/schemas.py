@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 
 
 class RifleBase(BaseModel):
@@ -39,3 +39,18 @@ class ShotCalculationResponse(BaseModel):
     drift_inches: float
     drift_moa: float
 
+
+class ShotBatchRequest(BaseModel):
+    """N shots for one rifle; the three lists must have the same length."""
+    distance_yards: List[float] = Field(..., example=[100, 200, 300])
+    wind_speed_mph: List[float] = Field(..., example=[10, 10, 10])
+    wind_angle_deg: List[float] = Field(..., example=[90, 90, 90])
+    rifle: RifleBase
+
+
+class ShotBatchResponse(BaseModel):
+    drop_inches: List[float]
+    drop_moa: List[float]
+    drift_inches: List[float]
+    drift_moa: List[float]
+
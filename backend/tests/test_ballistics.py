@@ -0,0 +1,130 @@
+import math
+
+import numpy as np
+import pytest
+
+from app.ballistics import compute_drop, compute_shot, compute_shots, compute_wind_drift
+from app.ballistics_kernels import (
+    HALF_G,
+    INCHES_PER_METER,
+    MOA_PER_INCH_AT_100,
+    TOF_FACTOR,
+    _pow08,
+    _shot_core,
+    _sin_deg,
+)
+
+# Documented error bounds of the kernel's approximations
+SIN_TABLE_MAX_ERR = 4e-5   # linear interpolation between integer degrees
+POW08_MAX_REL_ERR = 8.5e-6  # cubic fit of x**0.8 on [0.8, 1.2]
+
+
+def _reference_shot(distance_yards, muzzle_velocity_fps, zero_yards,
+                    wind_speed_mph, wind_angle_deg):
+    """
+    Straight math.sin / ** implementation of the drop + drift model, with
+    none of the kernel's table/polynomial approximations. The kernels are
+    tested against this within their documented error bounds.
+    """
+    t_zero = zero_yards * TOF_FACTOR / muzzle_velocity_fps
+    t_target = distance_yards * TOF_FACTOR / muzzle_velocity_fps
+    drop_inches = HALF_G * (t_target * t_target - t_zero * t_zero) * INCHES_PER_METER
+
+    distance_hundreds = distance_yards / 100.0
+    moa_per_inch = MOA_PER_INCH_AT_100 / distance_hundreds
+    drop_moa = drop_inches * moa_per_inch
+
+    sin_theta = math.sin(math.radians(wind_angle_deg))
+    velocity_factor = (muzzle_velocity_fps / 2700.0) ** 0.8
+    drift_inches = (wind_speed_mph * distance_hundreds ** 2 * abs(sin_theta) * 0.167) / velocity_factor
+    drift_inches = math.copysign(drift_inches, sin_theta)
+    drift_moa = drift_inches * moa_per_inch
+
+    return drop_inches, drop_moa, drift_inches, drift_moa
+
+
+def test_zero_angle_drift_is_exactly_zero():
+    # Head wind: sin(0) is exactly 0.0 in the table, so no drift at all
+    drift = compute_wind_drift(300.0, 2700.0, 10.0, 0.0)
+    assert drift.inches == 0.0
+    assert drift.moa == 0.0
+
+
+def test_tail_wind_drift_is_negligible():
+    # sin(pi) is ~1.2e-16 rather than exactly zero, table and math.sin alike
+    drift = compute_wind_drift(300.0, 2700.0, 10.0, 180.0)
+    assert abs(drift.inches) < 1e-12
+
+
+def test_crosswind_sign_convention():
+    right = compute_wind_drift(300.0, 2700.0, 10.0, 90.0)
+    left = compute_wind_drift(300.0, 2700.0, 10.0, 270.0)
+    assert right.inches > 0 > left.inches
+    assert right.inches == pytest.approx(-left.inches)
+
+
+def test_sin_table_exact_at_integer_degrees():
+    for angle in (0, 45, 90, 180, 270, 359, 360, 450):
+        expected = math.sin(math.radians(angle % 360))
+        assert _sin_deg(float(angle)) == pytest.approx(expected, abs=1e-12)
+
+
+def test_sin_table_interpolation_within_bound():
+    angles = np.arange(0.0, 360.0, 0.1)
+    worst = max(abs(_sin_deg(a) - math.sin(math.radians(a))) for a in angles)
+    assert worst < SIN_TABLE_MAX_ERR
+
+
+def test_pow08_within_bound_inside_fit_range():
+    xs = np.linspace(0.8, 1.2, 401)
+    worst = max(abs(_pow08(x) - x ** 0.8) / x ** 0.8 for x in xs)
+    assert worst < POW08_MAX_REL_ERR
+
+
+def test_pow08_exact_outside_fit_range():
+    for x in (0.3, 0.79, 1.21, 2.0):
+        assert _pow08(x) == x ** 0.8
+
+
+def test_shot_core_matches_reference():
+    # Integer angles hit the sine table exactly, so the only approximation
+    # left on the drift is the x**0.8 cubic; drop has no approximations.
+    for distance in (100.0, 300.0, 650.0, 1000.0):
+        for velocity in (2200.0, 2700.0, 3200.0):
+            for wind in (0.0, 7.5, 20.0):
+                for angle in (0.0, 33.0, 90.0, 215.0):
+                    got = _shot_core(distance, velocity, 200.0, wind, angle)
+                    want = _reference_shot(distance, velocity, 200.0, wind, angle)
+                    assert got[0] == pytest.approx(want[0], rel=1e-12)  # drop_inches
+                    assert got[1] == pytest.approx(want[1], rel=1e-12)  # drop_moa
+                    assert got[2] == pytest.approx(want[2], rel=2 * POW08_MAX_REL_ERR, abs=1e-12)
+                    assert got[3] == pytest.approx(want[3], rel=2 * POW08_MAX_REL_ERR, abs=1e-12)
+
+
+def test_compute_shots_matches_reference():
+    # The vectorized path uses np.sin and true pow: no approximations at all
+    distances = [100.0, 300.0, 650.0, 1000.0]
+    winds = [0.0, 7.5, 20.0, 12.0]
+    angles = [0.0, 33.7, 90.0, 215.0]
+    batch = compute_shots(distances, 2700.0, 200.0, winds, angles)
+    for i, (d, w, a) in enumerate(zip(distances, winds, angles)):
+        want = _reference_shot(d, 2700.0, 200.0, w, a)
+        assert batch["drop_inches"][i] == pytest.approx(want[0], rel=1e-12)
+        assert batch["drop_moa"][i] == pytest.approx(want[1], rel=1e-12)
+        assert batch["drift_inches"][i] == pytest.approx(want[2], rel=1e-12, abs=1e-15)
+        assert batch["drift_moa"][i] == pytest.approx(want[3], rel=1e-12, abs=1e-15)
+
+
+def test_compute_shot_and_wrappers_agree():
+    shot = compute_shot(300.0, 2700.0, 200.0, 10.0, 90.0)
+    drop = compute_drop(300.0, 2700.0, 200.0)
+    drift = compute_wind_drift(300.0, 2700.0, 10.0, 90.0)
+    assert shot.drop_inches == pytest.approx(drop.inches)
+    assert shot.drop_moa == pytest.approx(drop.moa)
+    assert shot.drift_inches == pytest.approx(drift.inches)
+    assert shot.drift_moa == pytest.approx(drift.moa)
+
+
+def test_compute_shot_rejects_nonpositive_velocity():
+    with pytest.raises(ValueError):
+        compute_shot(300.0, 0.0, 200.0, 10.0, 90.0)